@@ -9,6 +9,9 @@
 
 import csv
 
+from superstore_aggregates import Count, Mean
+from superstore_dataset import Dataset
+
 
 def load_samplestores(csv_file):
     """
@@ -40,10 +43,7 @@ def filter_out(data, state, segment):
     Input: data (list of dict), state (str), segment (str)
     Output: filtered_data (list of dict) - filtered records
     """
-    filtered_data = []
-    for row in data:
-        if row.get('State') == state and row.get('Segment') == segment:
-            filtered_data.append(row)
+    filtered_data = Dataset.from_records(data).where({'State': state, 'Segment': segment}).collect()
     print(f"Filtered to {len(filtered_data)} records for {state}, {segment}")
     return filtered_data
 
@@ -59,18 +59,7 @@ def calculate_average(filtered_data):
         print("No data to calculate average from")
         return 0.0
     
-    total_profit = 0.0
-    count = 0
-    
-    for row in filtered_data:
-        try:
-            profit = float(row.get('Profit', 0))
-            total_profit += profit
-            count += 1
-        except ValueError:
-            continue
-    
-    average_profit = total_profit / count if count > 0 else 0.0
+    average_profit = Dataset.from_records(filtered_data).mean('Profit')
     print(f"Calculated average profit: ${average_profit:.2f}")
     return average_profit
 
@@ -92,30 +81,49 @@ def generate_output(average_profit, output_file):
         print(f"Error writing to output file: {e}")
 
 
-def main():
+def main(argv=None):
     """
-    Runs the program and calls the functions in a logical sequence
-    
-    Input: none
+    Runs the program: reads the CSV once, filtering and averaging in a single pass
+
+    Input: argv (list of str, optional) - command line arguments, defaults to sys.argv[1:]
     Output: none
     """
-    # Configuration
-    csv_file = "SampleSuperstore.csv"
-    state = "Michigan"
-    segment = "Consumer"
-    output_file = "average_profit_output.txt"
+    # Imported here so importing this module (e.g. from the tests) stays cheap
+    import argparse
+
+    # Configuration (the defaults answer the project question)
+    parser = argparse.ArgumentParser(description="Average profit for one state and segment.")
+    parser.add_argument('--csv', default="SampleSuperstore.csv", help="path to the CSV file")
+    parser.add_argument('--state', default="Michigan", help="State to keep")
+    parser.add_argument('--segment', default="Consumer", help="Segment to keep")
+    parser.add_argument('--output', default="average_profit_output.txt", help="file to write the result to")
+    args = parser.parse_args(argv)
     
     # Execute the workflow
     print("Starting profit analysis...")
-    data = load_samplestores(csv_file)
+    try:
+        dataset = Dataset.scan(args.csv).where({'State': args.state, 'Segment': args.segment})
+        count, average_profit = dataset.aggregate(Count(), Mean('Profit'))
+        # Nothing matched: only read the first row to tell an empty file from a filter without matches
+        has_rows = count > 0 or next(iter(Dataset.scan(args.csv)), None) is not None
+    except FileNotFoundError:
+        print(f"Error: File '{args.csv}' not found.")
+        print("Failed to load data. Exiting.")
+        return
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        print("Failed to load data. Exiting.")
+        return
     
-    if data:
-        filtered_data = filter_out(data, state, segment)
-        average_profit = calculate_average(filtered_data)
-        generate_output(average_profit, output_file)
-        print("Analysis complete!")
-    else:
+    # An empty file must not overwrite the last good report
+    if not has_rows:
         print("Failed to load data. Exiting.")
+        return
+    
+    print(f"Filtered to {count} records for {args.state}, {args.segment}")
+    print(f"Calculated average profit: ${average_profit:.2f}")
+    generate_output(average_profit, args.output)
+    print("Analysis complete!")
 
 
 if __name__ == "__main__":
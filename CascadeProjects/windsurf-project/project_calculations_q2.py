@@ -4,6 +4,9 @@
 
 import csv
 
+from superstore_aggregates import Count, Mean
+from superstore_dataset import Dataset
+
 
 def load_samplestores(csv_file):
     """
@@ -35,10 +38,7 @@ def filter_out(data, ship_model, category):
     Input: data (list of dict), ship_model (str), category (str)
     Output: filtered_data (list of dict) - filtered records
     """
-    filtered_data = []
-    for row in data:
-        if row.get('Ship Mode') == ship_model and row.get('Category') == category:
-            filtered_data.append(row)
+    filtered_data = Dataset.from_records(data).where({'Ship Mode': ship_model, 'Category': category}).collect()
     print(f"Filtered to {len(filtered_data)} records for {ship_model}, {category}")
     return filtered_data
 
@@ -54,18 +54,7 @@ def calculate_average(filtered_data):
         print("No data to calculate average from")
         return 0.0
     
-    total_sales = 0.0
-    count = 0
-    
-    for row in filtered_data:
-        try:
-            sales = float(row.get('Sales', 0))
-            total_sales += sales
-            count += 1
-        except ValueError:
-            continue
-    
-    average_sales = total_sales / count if count > 0 else 0.0
+    average_sales = Dataset.from_records(filtered_data).mean('Sales')
     print(f"Calculated average sales: ${average_sales:.2f}")
     return average_sales
 
@@ -87,30 +76,49 @@ def generate_output(average_sales, output_file):
         print(f"Error writing to output file: {e}")
 
 
-def main():
+def main(argv=None):
     """
-    Runs the program and calls the functions in a logical sequence
-    
-    Input: none
+    Runs the program: reads the CSV once, filtering and averaging in a single pass
+
+    Input: argv (list of str, optional) - command line arguments, defaults to sys.argv[1:]
     Output: none
     """
-    # Configuration
-    csv_file = "SampleSuperstore.csv"
-    ship_model = "Second Class"
-    category = "Furniture"
-    output_file = "average_sales_output.txt"
+    # Imported here so importing this module (e.g. from the tests) stays cheap
+    import argparse
+
+    # Configuration (the defaults answer the project question)
+    parser = argparse.ArgumentParser(description="Average sales for one ship mode and category.")
+    parser.add_argument('--csv', default="SampleSuperstore.csv", help="path to the CSV file")
+    parser.add_argument('--ship-model', default="Second Class", help="Ship Mode to keep")
+    parser.add_argument('--category', default="Furniture", help="Category to keep")
+    parser.add_argument('--output', default="average_sales_output.txt", help="file to write the result to")
+    args = parser.parse_args(argv)
     
     # Execute the workflow
     print("Starting sales analysis...")
-    data = load_samplestores(csv_file)
+    try:
+        dataset = Dataset.scan(args.csv).where({'Ship Mode': args.ship_model, 'Category': args.category})
+        count, average_sales = dataset.aggregate(Count(), Mean('Sales'))
+        # Nothing matched: only read the first row to tell an empty file from a filter without matches
+        has_rows = count > 0 or next(iter(Dataset.scan(args.csv)), None) is not None
+    except FileNotFoundError:
+        print(f"Error: File '{args.csv}' not found.")
+        print("Failed to load data. Exiting.")
+        return
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        print("Failed to load data. Exiting.")
+        return
     
-    if data:
-        filtered_data = filter_out(data, ship_model, category)
-        average_sales = calculate_average(filtered_data)
-        generate_output(average_sales, output_file)
-        print("Analysis complete!")
-    else:
+    # An empty file must not overwrite the last good report
+    if not has_rows:
         print("Failed to load data. Exiting.")
+        return
+    
+    print(f"Filtered to {count} records for {args.ship_model}, {args.category}")
+    print(f"Calculated average sales: ${average_sales:.2f}")
+    generate_output(average_sales, args.output)
+    print("Analysis complete!")
 
 
 if __name__ == "__main__":
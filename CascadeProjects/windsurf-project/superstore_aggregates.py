@@ -0,0 +1,288 @@
+# Superstore Aggregates
+# Aggregators used by the Dataset query engine (see superstore_dataset.py)
+
+# Every aggregator follows the same small protocol so the engine can feed them in one pass:
+#   columns  - tuple of the column names the aggregator reads from each matching row
+#   add()    - takes one value per column, in the same order as columns
+#   merge()  - folds in another aggregator of the same kind (used for chunked execution)
+#   empty()  - returns a fresh aggregator with the same settings and no data
+#   result() - returns the final answer
+
+import heapq
+import math
+
+# Passed to add() for a column that is not in the data at all, so a missing column
+# counts as 0 like row.get('Profit', 0), while an empty cell of a short row (None) is skipped
+MISSING = object()
+
+
+def to_number(value):
+    """
+    Converts a raw CSV value to a float the same way calculate_average does
+
+    Input: value (str, None or MISSING) - raw cell value, None for a cell missing from a short row
+    Output: number (float or None) - 0.0 for a missing column, None when the value cannot be used
+    """
+    if value is MISSING:
+        return 0.0
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class Count:
+    """
+    Counts the matching rows
+    """
+
+    columns = ()
+
+    def __init__(self):
+        self.count = 0
+
+    def add(self):
+        self.count += 1
+
+    def merge(self, other):
+        self.count += other.count
+
+    def empty(self):
+        return Count()
+
+    def result(self):
+        return self.count
+
+
+class Mean:
+    """
+    Averages a numeric column, skipping values that cannot be parsed
+    """
+
+    def __init__(self, column):
+        self.column = column
+        self.columns = (column,)
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value):
+        number = to_number(value)
+        if number is None:
+            return
+        self.total += number
+        self.count += 1
+
+    def merge(self, other):
+        self.total += other.total
+        self.count += other.count
+
+    def empty(self):
+        return Mean(self.column)
+
+    def result(self):
+        return self.total / self.count if self.count > 0 else 0.0
+
+
+class TopK:
+    """
+    Keeps the k largest values of a numeric column
+
+    Without by, a min-heap of k values is kept, so memory does not grow with the input.
+    With by, the column is summed per group (e.g. profit per City) and the k largest
+    totals are returned; memory then grows with the number of groups, not the number of rows.
+    """
+
+    def __init__(self, column, k=10, by=None):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.column = column
+        self.k = k
+        self.by = by
+        self.columns = (column,) if by is None else (column, by)
+        self.heap = []
+        self.totals = {}
+
+    def add(self, value, group=None):
+        number = to_number(value)
+        if number is None:
+            return
+        if self.by is not None:
+            if group is MISSING:
+                group = None
+            self.totals[group] = self.totals.get(group, 0.0) + number
+        elif len(self.heap) < self.k:
+            heapq.heappush(self.heap, number)
+        elif number > self.heap[0]:
+            heapq.heapreplace(self.heap, number)
+
+    def merge(self, other):
+        for group, total in other.totals.items():
+            self.totals[group] = self.totals.get(group, 0.0) + total
+        for number in other.heap:
+            self.add(number)
+
+    def empty(self):
+        return TopK(self.column, self.k, self.by)
+
+    def result(self):
+        """
+        Output: list of float (largest first), or list of (group, total) when by is set
+        """
+        if self.by is None:
+            return sorted(self.heap, reverse=True)
+        # Ties are broken by group name so the answer does not depend on row order
+        return heapq.nsmallest(self.k, self.totals.items(), key=lambda item: (-item[1], str(item[0])))
+
+
+class Quantiles:
+    """
+    Streaming quantile estimate of a numeric column using a KLL sketch
+
+    Values are kept in a stack of compactors. When a compactor is full it is sorted and every
+    other value is promoted to the next level with double weight, so memory stays around 3 * k
+    values however long the input is. Results are exact while fewer than about k values have
+    been added, and otherwise within roughly 1.7 / k of the true rank.
+    A quantile q returns the smallest value whose rank is at least q of all values.
+    """
+
+    def __init__(self, column, qs=(0.5,), k=200, seed=0):
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        # Imported here so scripts that only need the average do not pay for it at startup
+        import random
+
+        self.column = column
+        self.columns = (column,)
+        self.qs = tuple(qs)
+        self.k = k
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.compactors = [[]]
+        self.size = 0
+        self.count = 0
+        self.max_size = self._capacity(0)
+
+    def _capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def _compress(self):
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) >= self._capacity(level):
+                if level + 1 >= len(self.compactors):
+                    self._grow()
+                items = sorted(self.compactors[level])
+                # An odd value out stays behind so no weight is lost
+                keep = [items.pop()] if len(items) % 2 else []
+                offset = self.random.randint(0, 1)
+                self.compactors[level + 1].extend(items[offset::2])
+                self.compactors[level] = keep
+                break
+        self.size = sum(len(compactor) for compactor in self.compactors)
+
+    def add(self, value):
+        number = to_number(value)
+        if number is None:
+            return
+        self.compactors[0].append(number)
+        self.size += 1
+        self.count += 1
+        if self.size >= self.max_size:
+            self._compress()
+
+    def merge(self, other):
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.count += other.count
+        self.size = sum(len(compactor) for compactor in self.compactors)
+        while self.size >= self.max_size:
+            self._compress()
+
+    def empty(self):
+        return Quantiles(self.column, self.qs, self.k, self.seed)
+
+    def quantile(self, q):
+        """
+        Input: q (float) - between 0 and 1
+        Output: value (float) - estimated q-quantile, 0.0 when no values were added
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        weighted = sorted((number, 2 ** level)
+                          for level, compactor in enumerate(self.compactors)
+                          for number in compactor)
+        if not weighted:
+            return 0.0
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        seen = 0
+        for number, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return number
+        return weighted[-1][0]
+
+    def result(self):
+        return [self.quantile(q) for q in self.qs]
+
+
+class DistinctCount:
+    """
+    Estimated number of distinct values in a column (e.g. City, Postal Code, Sub-Category)
+    using a HyperLogLog sketch
+
+    Each value is hashed; the first p bits pick one of 2 ** p registers and the register keeps
+    the longest run of leading zeros seen in the remaining bits. With the default p = 12 the
+    sketch is 4 KB whatever the number of rows, and the typical error is about 1.6%.
+    Small counts fall back to linear counting, which is close to exact.
+    Missing values (None or MISSING) are not counted.
+    """
+
+    def __init__(self, column, p=12):
+        if not 4 <= p <= 16:
+            raise ValueError("p must be between 4 and 16")
+        # Imported here so scripts that only need the average do not pay for it at startup
+        import hashlib
+
+        self.hash = hashlib.blake2b
+        self.column = column
+        self.columns = (column,)
+        self.p = p
+        self.registers = bytearray(2 ** p)
+
+    def add(self, value):
+        if value is None or value is MISSING:
+            return
+        digest = self.hash(str(value).encode('utf-8'), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+        bits = 64 - self.p
+        register = hashed >> bits
+        rest = hashed & ((1 << bits) - 1)
+        rank = bits - rest.bit_length() + 1
+        if rank > self.registers[register]:
+            self.registers[register] = rank
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError("Cannot merge distinct counts with different precision")
+        self.registers = bytearray(max(pair) for pair in zip(self.registers, other.registers))
+
+    def empty(self):
+        return DistinctCount(self.column, self.p)
+
+    def result(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
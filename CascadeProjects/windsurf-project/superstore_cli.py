@@ -0,0 +1,200 @@
+# Superstore CLI
+# Command line entry point for querying the superstore CSV data
+
+# Example:
+#   python superstore_cli.py --csv SampleSuperstore.csv --where State=Michigan --where Segment=Consumer \
+#       --metric mean --column Profit --output average_profit_output.txt
+# Startup is kept small because cron jobs run this many times an hour: only sys is imported at
+# module level, argparse and the query engine are imported inside main() when they are needed,
+# and the sketch aggregators load their own dependencies only when they are created.
+
+import sys
+
+METRICS = ('mean', 'count', 'quantile', 'top_k', 'distinct_count')
+MONEY_COLUMNS = ('Sales', 'Profit')
+
+
+def build_parser():
+    """
+    Builds the argument parser for the command line
+
+    Input: none
+    Output: parser (argparse.ArgumentParser)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the superstore CSV data in a single pass.")
+    parser.add_argument('--csv', default="SampleSuperstore.csv", help="path to the CSV file")
+    parser.add_argument('--where', action='append', default=[], metavar='COLUMN=VALUE',
+                        help="keep rows where COLUMN equals VALUE (can be repeated)")
+    parser.add_argument('--metric', choices=METRICS, default='mean', help="what to calculate")
+    parser.add_argument('--column', default='Profit', help="column the metric is calculated on")
+    parser.add_argument('--q', type=float, default=0.5, help="quantile between 0 and 1 (quantile metric)")
+    parser.add_argument('--k', type=int, default=10, help="number of results (top_k metric)")
+    parser.add_argument('--by', help="group column to total by (top_k metric)")
+    parser.add_argument('--output', help="file to write the result to")
+    return parser
+
+
+def parse_filters(pairs):
+    """
+    Turns COLUMN=VALUE strings into a filter dict
+
+    Input: pairs (list of str) - e.g. ['State=Michigan', 'Ship Mode=Second Class']
+    Output: filters (dict) - column name to required value
+    """
+    filters = {}
+    for pair in pairs:
+        column, separator, value = pair.partition('=')
+        if not separator or not column:
+            raise ValueError(f"Filter '{pair}' should look like COLUMN=VALUE")
+        filters[column] = value
+    return filters
+
+
+def run_query(csv_file, filters, metric, column, q=0.5, k=10, by=None):
+    """
+    Runs one metric over the matching rows of the CSV file
+
+    Input: csv_file (str), filters (dict), metric (str) - one of METRICS, column (str),
+           q (float), k (int), by (str or None)
+    Output: result - float, int or list depending on the metric
+    """
+    return run_query_with_count(csv_file, filters, metric, column, q, k, by)[1]
+
+
+def run_query_with_count(csv_file, filters, metric, column, q=0.5, k=10, by=None):
+    """
+    Runs one metric over the matching rows of the CSV file and counts those rows in the same pass
+
+    Input: same as run_query
+    Output: (count, result) - number of matching rows (int) and the metric result
+    """
+    from superstore_aggregates import Count, DistinctCount, Mean, Quantiles, TopK
+    from superstore_dataset import Dataset
+
+    if metric == 'mean':
+        aggregator = Mean(column)
+    elif metric == 'count':
+        aggregator = Count()
+    elif metric == 'quantile':
+        aggregator = Quantiles(column, [q])
+    elif metric == 'top_k':
+        aggregator = TopK(column, k, by)
+    elif metric == 'distinct_count':
+        aggregator = DistinctCount(column)
+    else:
+        raise ValueError(f"Unknown metric '{metric}'")
+
+    count, result = Dataset.scan(csv_file).where(filters).aggregate(Count(), aggregator)
+    if metric == 'quantile':
+        result = result[0]
+    return count, result
+
+
+def has_rows(csv_file):
+    """
+    Checks whether the CSV file has at least one record, reading only up to the first one
+
+    Input: csv_file (str)
+    Output: bool
+    """
+    from superstore_dataset import Dataset
+
+    return next(iter(Dataset.scan(csv_file)), None) is not None
+
+
+def format_result(result, metric, column, q=0.5, by=None):
+    """
+    Formats a result as report lines in the same layout as generate_output
+
+    Input: result, metric (str), column (str), q (float), by (str or None)
+    Output: lines (list of str)
+    """
+    def number(value):
+        return f"${value:.2f}" if column in MONEY_COLUMNS else f"{value:.2f}"
+
+    if metric == 'mean':
+        label = f"Average {column}"
+        body = [f"{label}: {number(result)}"]
+    elif metric == 'count':
+        label = "Row Count"
+        body = [f"{label}: {result}"]
+    elif metric == 'quantile':
+        label = f"P{q * 100:g} {column}"
+        body = [f"{label}: {number(result)}"]
+    elif metric == 'top_k':
+        label = f"Top {column}" if by is None else f"Top {column} by {by}"
+        if by is None:
+            body = [f"{rank}. {number(value)}" for rank, value in enumerate(result, 1)]
+        else:
+            body = [f"{rank}. {group}: {number(total)}" for rank, (group, total) in enumerate(result, 1)]
+    else:
+        label = f"Distinct {column}"
+        body = [f"{label}: {result}"]
+
+    title = f"{label} Analysis"
+    return [title, "=" * len(title)] + body
+
+
+def generate_output(lines, output_file):
+    """
+    Writes the report lines to an output file
+
+    Input: lines (list of str), output_file (str)
+    Output: None
+    """
+    try:
+        with open(output_file, 'w') as file:
+            for line in lines:
+                file.write(f"{line}\n")
+        print(f"Output written to {output_file}")
+    except Exception as e:
+        print(f"Error writing to output file: {e}")
+
+
+def main(argv=None):
+    """
+    Parses the command line, runs the query and prints (and optionally writes) the result
+
+    Input: argv (list of str, optional) - defaults to sys.argv[1:]
+    Output: exit code (int) - 0 on success, 1 on error
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        filters = parse_filters(args.where)
+    except ValueError as e:
+        parser.error(str(e))
+    # Checked up front so a bad value fails before the file is scanned
+    if not 0 <= args.q <= 1:
+        parser.error("--q must be between 0 and 1")
+    if args.k < 1:
+        parser.error("--k must be at least 1")
+
+    try:
+        count, result = run_query_with_count(args.csv, filters, args.metric, args.column, args.q, args.k, args.by)
+        # Nothing matched: only read the first row to tell an empty file from a filter without matches
+        empty = count == 0 and not has_rows(args.csv)
+    except FileNotFoundError:
+        print(f"Error: File '{args.csv}' not found.")
+        return 1
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+    # An empty file must not overwrite the last good report
+    if empty:
+        print(f"Error: File '{args.csv}' has no records.")
+        return 1
+
+    lines = format_result(result, args.metric, args.column, args.q, args.by)
+    for line in lines:
+        print(line)
+    if args.output:
+        generate_output(lines, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# Superstore Dataset
+# Lazy query API over the superstore CSV data
+
+# Example:
+#   Dataset.scan("SampleSuperstore.csv").where(State="Michigan", Segment="Consumer").mean("Profit")
+# Nothing is read until a terminal operation (mean, count, top_k, quantiles,
+# distinct_count, aggregate, collect) is called.
+# The terminal operation then reads the file once, keeps only the columns the query needs,
+# checks the filters and feeds the aggregators row by row, so no intermediate list is built.
+
+import csv
+
+from superstore_aggregates import MISSING, Count, DistinctCount, Mean, Quantiles, TopK
+
+
+class _CsvSource:
+    """
+    Streams rows from a CSV file on disk
+    """
+
+    def __init__(self, csv_file):
+        self.csv_file = csv_file
+
+    def scan(self, filters, columns):
+        """
+        Yields the requested column values of every row that matches all the filters
+
+        Input: filters (list of (str, str)), columns (list of str)
+        Output: generator of tuples - one value per requested column
+        """
+        with open(self.csv_file, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Later duplicates win, the same as csv.DictReader
+            index = {name: i for i, name in enumerate(header)}
+            width = len(header)
+            # Filters on columns missing from the header never match; picked ones read as MISSING
+            checks = [(index.get(column), value) for column, value in filters]
+            picks = [index.get(column) for column in columns]
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    row = row + [None] * (width - len(row))
+                if all(i is not None and row[i] == value for i, value in checks):
+                    yield tuple(MISSING if i is None else row[i] for i in picks)
+
+    def rows(self, filters):
+        """
+        Yields every full row (dict) that matches all the filters
+
+        Input: filters (list of (str, str))
+        Output: generator of dict
+        """
+        with open(self.csv_file, 'r', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                if all(row.get(column) == value for column, value in filters):
+                    yield row
+
+    def describe(self):
+        return f"scan({self.csv_file!r})"
+
+
+class _RecordSource:
+    """
+    Reads rows from data that is already loaded in memory (list of dict)
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    def scan(self, filters, columns):
+        for row in self.rows(filters):
+            yield tuple(row.get(column, MISSING) for column in columns)
+
+    def rows(self, filters):
+        for row in self.data:
+            if all(row.get(column) == value for column, value in filters):
+                yield row
+
+    def describe(self):
+        return f"records({len(self.data)} rows)"
+
+
+class Dataset:
+    """
+    A lazy query over the superstore data: a source plus the filters to apply to it
+
+    Each builder method (where) returns a new Dataset and leaves the original unchanged,
+    so partial queries can be shared and extended.
+    """
+
+    def __init__(self, source, filters=()):
+        self._source = source
+        self._filters = tuple(filters)
+
+    @classmethod
+    def scan(cls, csv_file):
+        """
+        Creates a lazy dataset over a CSV file; the file is not opened until a terminal operation
+
+        Input: csv_file (str) - path to the CSV file
+        Output: Dataset
+        """
+        return cls(_CsvSource(csv_file))
+
+    @classmethod
+    def from_records(cls, data):
+        """
+        Creates a dataset over rows that are already loaded, e.g. the output of load_samplestores
+
+        Input: data (list of dict)
+        Output: Dataset
+        """
+        return cls(_RecordSource(data))
+
+    def where(self, filters=None, **columns):
+        """
+        Keeps only the rows whose columns equal the given values
+
+        Column names with spaces can be passed as a dict, e.g. where({'Ship Mode': 'Second Class'})
+
+        Input: filters (dict, optional), columns (keyword arguments) - column name to required value
+        Output: Dataset - a new dataset with the extra filters
+        """
+        added = list((filters or {}).items()) + list(columns.items())
+        return Dataset(self._source, self._filters + tuple(added))
+
+    def aggregate(self, *aggregators, chunk_size=None):
+        """
+        Runs the query once and feeds every matching row to all the aggregators
+
+        The aggregators are updated in place, so their state can be merged with the state
+        from other datasets (e.g. other files) afterwards. With chunk_size set, every chunk
+        of matching rows is aggregated separately and merged in, the same way a parallel
+        run would combine its partial results.
+
+        Input: aggregators (aggregator objects), chunk_size (int, optional)
+        Output: results (list) - the result of each aggregator, in order
+        """
+        columns = []
+        for aggregator in aggregators:
+            for column in aggregator.columns:
+                if column not in columns:
+                    columns.append(column)
+        picks = [[columns.index(column) for column in aggregator.columns] for aggregator in aggregators]
+        feeds = list(zip(aggregators, picks))
+
+        if chunk_size is None:
+            for values in self._source.scan(self._filters, columns):
+                for aggregator, pick in feeds:
+                    aggregator.add(*[values[i] for i in pick])
+        else:
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be at least 1")
+            chunk = None
+            seen = 0
+            for values in self._source.scan(self._filters, columns):
+                if chunk is None:
+                    chunk = [(aggregator.empty(), pick) for aggregator, pick in feeds]
+                for aggregator, pick in chunk:
+                    aggregator.add(*[values[i] for i in pick])
+                seen += 1
+                if seen == chunk_size:
+                    for aggregator, (partial, _) in zip(aggregators, chunk):
+                        aggregator.merge(partial)
+                    chunk = None
+                    seen = 0
+            if chunk is not None:
+                for aggregator, (partial, _) in zip(aggregators, chunk):
+                    aggregator.merge(partial)
+
+        return [aggregator.result() for aggregator in aggregators]
+
+    def mean(self, column):
+        """
+        Average of a numeric column over the matching rows (0.0 when nothing matches)
+
+        Input: column (str)
+        Output: average (float)
+        """
+        return self.aggregate(Mean(column))[0]
+
+    def top_k(self, column, k=10, by=None):
+        """
+        The k largest values of a numeric column, or the k largest per-group totals when by is set
+
+        Input: column (str), k (int), by (str, optional) - e.g. top_k('Profit', 10, by='City')
+        Output: list of float, or list of (group, total) when by is set
+        """
+        return self.aggregate(TopK(column, k, by))[0]
+
+    def quantiles(self, column, qs=(0.5,)):
+        """
+        Estimated quantiles of a numeric column, e.g. quantiles('Sales', [0.5, 0.95])
+
+        Input: column (str), qs (list of float) - each between 0 and 1
+        Output: list of float - one estimate per quantile
+        """
+        return self.aggregate(Quantiles(column, qs))[0]
+
+    def distinct_count(self, column):
+        """
+        Estimated number of distinct values of a column over the matching rows
+
+        Input: column (str) - e.g. 'City', 'Postal Code' or 'Sub-Category'
+        Output: count (int)
+        """
+        return self.aggregate(DistinctCount(column))[0]
+
+    def count(self):
+        """
+        Number of matching rows
+
+        Input: none
+        Output: count (int)
+        """
+        return self.aggregate(Count())[0]
+
+    def collect(self):
+        """
+        Materializes the matching rows
+
+        Input: none
+        Output: data (list of dict)
+        """
+        return list(self._source.rows(self._filters))
+
+    def cache(self):
+        """
+        Materializes the matching rows once and returns a dataset over them,
+        so several queries on the same subset do not re-read the file
+
+        Input: none
+        Output: Dataset
+        """
+        return Dataset.from_records(self.collect())
+
+    def __iter__(self):
+        return self._source.rows(self._filters)
+
+    def __repr__(self):
+        plan = self._source.describe()
+        for column, value in self._filters:
+            plan += f".where({column!r} == {value!r})"
+        return f"Dataset({plan})"
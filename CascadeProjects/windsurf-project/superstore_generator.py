@@ -0,0 +1,156 @@
+# Superstore Generator
+# Creates synthetic data with the SampleSuperstore.csv columns, for testing at any size
+
+# Example:
+#   python superstore_generator.py --rows 1000000 --seed 7 --output big_superstore.csv
+# The same seed always gives the same rows. Categorical columns are skewed (a few states,
+# cities and ship modes make up most rows, like the real file), and a small share of the
+# numeric cells are malformed ('', 'N/A', '$12.50', '1,234.56', ...) so that every code path
+# has to skip them the same way calculate_average does. A share of rows can also be truncated
+# (the last cells are missing, as in a cut-off line), which csv.DictReader reads as None.
+
+import csv
+import itertools
+import random
+
+COLUMNS = ['Ship Mode', 'Segment', 'Country', 'City', 'State', 'Postal Code', 'Region',
+           'Category', 'Sub-Category', 'Sales', 'Quantity', 'Discount', 'Profit']
+
+# All weights below are cumulative, as random.choices(cum_weights=...) expects
+SHIP_MODES = ['Standard Class', 'Second Class', 'First Class', 'Same Day']
+SHIP_MODE_WEIGHTS = list(itertools.accumulate([60, 19, 15, 6]))
+
+SEGMENTS = ['Consumer', 'Corporate', 'Home Office']
+SEGMENT_WEIGHTS = list(itertools.accumulate([52, 30, 18]))
+
+# State, region and cities, most common first
+LOCATIONS = [
+    ('California', 'West', ['Los Angeles', 'San Francisco', 'San Diego', 'Fresno']),
+    ('New York', 'East', ['New York City', 'Buffalo', 'Rochester']),
+    ('Texas', 'Central', ['Houston', 'Dallas', 'San Antonio', 'Austin']),
+    ('Pennsylvania', 'East', ['Philadelphia', 'Pittsburgh']),
+    ('Washington', 'West', ['Seattle', 'Spokane']),
+    ('Illinois', 'Central', ['Chicago', 'Springfield']),
+    ('Ohio', 'East', ['Columbus', 'Cleveland', 'Toledo']),
+    ('Florida', 'South', ['Jacksonville', 'Miami', 'Tampa']),
+    ('Michigan', 'Central', ['Detroit', 'Jackson', 'Lansing', 'Ann Arbor', 'Grand Rapids']),
+    ('North Carolina', 'South', ['Charlotte', 'Raleigh']),
+    ('Kentucky', 'South', ['Henderson', 'Louisville']),
+    ('Wyoming', 'West', ['Cheyenne']),
+]
+
+CATEGORIES = [
+    ('Office Supplies', ['Binders', 'Paper', 'Storage', 'Art', 'Appliances', 'Labels', 'Envelopes', 'Fasteners', 'Supplies']),
+    ('Furniture', ['Furnishings', 'Chairs', 'Tables', 'Bookcases']),
+    ('Technology', ['Phones', 'Accessories', 'Machines', 'Copiers']),
+]
+CATEGORY_WEIGHTS = list(itertools.accumulate([60, 21, 19]))
+
+MALFORMED_VALUES = ['', 'N/A', 'null', '-', '$12.50', '1,234.56', '12.5.1', 'abc']
+
+
+def skewed_weights(count):
+    """
+    Zipf-like cumulative weights: the first item is the most common, then 1/2, 1/3, ... as often
+
+    Input: count (int)
+    Output: cum_weights (list of float) - for random.choices(cum_weights=...)
+    """
+    return list(itertools.accumulate(1 / rank for rank in range(1, count + 1)))
+
+
+def generate_rows(count, seed=0, malformed_rate=0.02, truncated_rate=0.01):
+    """
+    Generates synthetic superstore rows
+
+    Input: count (int) - number of rows, seed (int) - same seed gives the same rows,
+           malformed_rate (float) - share of numeric cells replaced with a value that cannot be parsed,
+           truncated_rate (float) - share of rows whose last cells are missing
+    Output: generator of dict - one row per record, with string values like csv.DictReader gives
+            (None for the cells a truncated row is missing)
+    """
+    generator = random.Random(seed)
+    location_weights = skewed_weights(len(LOCATIONS))
+    city_weights = {state: skewed_weights(len(cities)) for state, _, cities in LOCATIONS}
+    sub_category_weights = {category: skewed_weights(len(subs)) for category, subs in CATEGORIES}
+    quantities = range(1, 15)
+    quantity_weights = skewed_weights(len(quantities))
+
+    def numeric(text):
+        if generator.random() < malformed_rate:
+            return generator.choice(MALFORMED_VALUES)
+        return text
+
+    for _ in range(count):
+        location_index = generator.choices(range(len(LOCATIONS)), cum_weights=location_weights)[0]
+        state, region, cities = LOCATIONS[location_index]
+        city_index = generator.choices(range(len(cities)), cum_weights=city_weights[state])[0]
+        category, sub_categories = generator.choices(CATEGORIES, cum_weights=CATEGORY_WEIGHTS)[0]
+        # Every city has a few postal codes, derived from its position in the tables
+        postal_code = 10000 + location_index * 5000 + city_index * 100 + generator.randrange(4)
+
+        # Sales have a long tail, most orders are small
+        sales = round(generator.lognormvariate(4.5, 1.3), 2)
+        quantity = generator.choices(quantities, cum_weights=quantity_weights)[0]
+        discount = generator.choice([0, 0, 0, 0.1, 0.2, 0.2, 0.3, 0.5, 0.8])
+        profit = round(sales * (generator.gauss(0.15, 0.1) - discount * 0.6), 4)
+
+        row = {
+            'Ship Mode': generator.choices(SHIP_MODES, cum_weights=SHIP_MODE_WEIGHTS)[0],
+            'Segment': generator.choices(SEGMENTS, cum_weights=SEGMENT_WEIGHTS)[0],
+            'Country': 'United States',
+            'City': cities[city_index],
+            'State': state,
+            'Postal Code': str(postal_code),
+            'Region': region,
+            'Category': category,
+            'Sub-Category': generator.choices(sub_categories, cum_weights=sub_category_weights[category])[0],
+            'Sales': numeric(str(sales)),
+            'Quantity': numeric(str(quantity)),
+            'Discount': numeric(str(discount)),
+            'Profit': numeric(str(profit)),
+        }
+        if generator.random() < truncated_rate:
+            # Keep at least one cell so the line is not blank
+            for column in COLUMNS[generator.randrange(1, len(COLUMNS)):]:
+                row[column] = None
+        yield row
+
+
+def write_csv(output_file, count, seed=0, malformed_rate=0.02, truncated_rate=0.01):
+    """
+    Writes synthetic superstore rows to a CSV file; truncated rows are written as short lines
+
+    Input: output_file (str), count (int), seed (int), malformed_rate (float), truncated_rate (float)
+    Output: None
+    """
+    with open(output_file, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        for row in generate_rows(count, seed, malformed_rate, truncated_rate):
+            writer.writerow([row[column] for column in COLUMNS if row[column] is not None])
+
+
+def main(argv=None):
+    """
+    Writes a synthetic CSV file from the command line
+
+    Input: argv (list of str, optional) - defaults to sys.argv[1:]
+    Output: none
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic SampleSuperstore-style data.")
+    parser.add_argument('--rows', type=int, default=10000, help="number of rows")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--malformed-rate', type=float, default=0.02, help="share of malformed numeric cells")
+    parser.add_argument('--truncated-rate', type=float, default=0.01, help="share of truncated rows")
+    parser.add_argument('--output', default="synthetic_superstore.csv", help="CSV file to write")
+    args = parser.parse_args(argv)
+
+    write_csv(args.output, args.rows, args.seed, args.malformed_rate, args.truncated_rate)
+    print(f"Wrote {args.rows} records to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import csv
+import os
+import random
+from superstore_dataset import Dataset
+from superstore_aggregates import TopK, Quantiles, DistinctCount
+
+
+def exact_quantile(values, q):
+    """Smallest value whose rank is at least q of all values (the definition Quantiles uses)"""
+    ordered = sorted(values)
+    for i, value in enumerate(ordered):
+        if i + 1 >= q * len(ordered):
+            return value
+    return ordered[-1]
+
+
+def test_top_k():
+    """Test cases for TopK aggregator"""
+    print("\n--- Testing TopK ---")
+
+    # Test 1: General case - largest values, largest first
+    print("\nTest 1 (General): Largest values, largest first")
+    top = TopK('Profit', k=3)
+    for value in ['5', '1', '9', '-2', '7', '3']:
+        top.add(value)
+    assert top.result() == [9.0, 7.0, 5.0], "Should keep the 3 largest values"
+    print("✓ Passed")
+
+    # Test 2: General case - top groups by total on a filtered scan
+    print("\nTest 2 (General): Top cities by total profit")
+    test_file = "test_aggregates_1.csv"
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['State', 'Segment', 'City', 'Profit'])
+        writer.writerow(['Michigan', 'Consumer', 'Detroit', '100'])
+        writer.writerow(['Michigan', 'Consumer', 'Ann Arbor', '80'])
+        writer.writerow(['Michigan', 'Consumer', 'Detroit', '-30'])
+        writer.writerow(['Michigan', 'Consumer', 'Lansing', '60'])
+        writer.writerow(['Michigan', 'Corporate', 'Lansing', '500'])
+        writer.writerow(['Michigan', 'Consumer', 'Lansing', 'bad'])
+    dataset = Dataset.scan(test_file).where(State='Michigan', Segment='Consumer')
+    result = dataset.top_k('Profit', 2, by='City')
+    assert result == [('Ann Arbor', 80.0), ('Detroit', 70.0)], "Should rank cities by total profit"
+    print("✓ Passed")
+    os.remove(test_file)
+
+    # Test 3: Edge case - merged heaps match a single heap
+    print("\nTest 3 (Edge): Merged heaps match a single heap")
+    generator = random.Random(1)
+    values = [str(generator.uniform(-100, 100)) for _ in range(50)]
+    whole = TopK('Sales', k=5)
+    first = TopK('Sales', k=5)
+    second = TopK('Sales', k=5)
+    for i, value in enumerate(values):
+        whole.add(value)
+        (first if i % 2 else second).add(value)
+    first.merge(second)
+    assert first.result() == whole.result(), "Merged result should match"
+    print("✓ Passed")
+
+    # Test 4: Edge case - fewer values than k
+    print("\nTest 4 (Edge): Fewer values than k")
+    top = TopK('Profit', k=10)
+    top.add('4')
+    top.add('N/A')
+    assert top.result() == [4.0], "Should return only the parsable values"
+    assert TopK('Profit', k=10).result() == [], "Should return an empty list with no data"
+    print("✓ Passed")
+
+
+def test_quantiles():
+    """Test cases for Quantiles aggregator"""
+    print("\n--- Testing Quantiles ---")
+
+    # Test 1: General case - exact on small inputs
+    print("\nTest 1 (General): Exact on small inputs")
+    sketch = Quantiles('Sales', qs=[0.0, 0.5, 0.95, 1.0])
+    generator = random.Random(2)
+    values = [generator.uniform(0, 1000) for _ in range(150)]
+    for value in values:
+        sketch.add(str(value))
+    expected = [exact_quantile(values, q) for q in [0.0, 0.5, 0.95, 1.0]]
+    assert sketch.result() == expected, "Should match the exact quantiles"
+    print("✓ Passed")
+
+    # Test 2: General case - bounded rank error and memory on a large input
+    print("\nTest 2 (General): Bounded rank error and memory on a large input")
+    generator = random.Random(3)
+    values = [generator.expovariate(0.01) for _ in range(100000)]
+    sketch = Quantiles('Sales', qs=[0.5, 0.95])
+    for value in values:
+        sketch.add(value)
+    ordered = sorted(values)
+    for q, estimate in zip([0.5, 0.95], sketch.result()):
+        rank = ordered.index(estimate) / len(ordered)
+        assert abs(rank - q) < 0.02, "Estimated rank should be within 2% of the target"
+    assert sketch.size < 3 * sketch.k + 50, "Sketch should hold about 3 * k values"
+    print("✓ Passed")
+
+    # Test 3: Edge case - chunked execution stays accurate
+    print("\nTest 3 (Edge): Chunked execution stays accurate")
+    data = [{'Sales': str(value)} for value in values[:20000]]
+    ordered = sorted(values[:20000])
+    result = Dataset.from_records(data).aggregate(Quantiles('Sales', qs=[0.5]), chunk_size=1000)[0]
+    rank = ordered.index(result[0]) / len(ordered)
+    assert abs(rank - 0.5) < 0.02, "Merged sketch should stay within 2% of the target"
+    print("✓ Passed")
+
+    # Test 4: Edge case - no data
+    print("\nTest 4 (Edge): No data")
+    assert Quantiles('Sales', qs=[0.5, 0.95]).result() == [0.0, 0.0], "Should return 0.0 with no data"
+    try:
+        Quantiles('Sales').quantile(1.5)
+        assert False, "Quantile above 1 should raise"
+    except ValueError:
+        pass
+    print("✓ Passed")
+
+
+def test_distinct_count():
+    """Test cases for DistinctCount aggregator"""
+    print("\n--- Testing DistinctCount ---")
+
+    # Test 1: General case - small counts are exact
+    print("\nTest 1 (General): Small counts are exact")
+    test_file = "test_aggregates_2.csv"
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['State', 'Segment', 'City', 'Postal Code'])
+        writer.writerow(['Michigan', 'Consumer', 'Detroit', '48201'])
+        writer.writerow(['Michigan', 'Consumer', 'Detroit', '48202'])
+        writer.writerow(['Michigan', 'Consumer', 'Lansing', '48933'])
+        writer.writerow(['Michigan', 'Consumer', 'Detroit', '48201'])
+        writer.writerow(['Michigan', 'Corporate', 'Flint', '48502'])
+    dataset = Dataset.scan(test_file).where(State='Michigan', Segment='Consumer')
+    assert dataset.distinct_count('City') == 2, "Should count 2 distinct cities"
+    assert dataset.distinct_count('Postal Code') == 3, "Should count 3 distinct postal codes"
+    print("✓ Passed")
+    os.remove(test_file)
+
+    # Test 2: General case - large counts within a few percent and fixed memory
+    print("\nTest 2 (General): Large counts within a few percent and fixed memory")
+    sketch = DistinctCount('Postal Code')
+    for i in range(200000):
+        sketch.add(str(i % 50000))
+    assert abs(sketch.result() - 50000) < 50000 * 0.05, "Estimate should be within 5%"
+    assert len(sketch.registers) == 4096, "Sketch should stay at 4 KB"
+    print("✓ Passed")
+
+    # Test 3: Edge case - merging two sketches counts the union
+    print("\nTest 3 (Edge): Merging two sketches counts the union")
+    first = DistinctCount('City')
+    second = DistinctCount('City')
+    whole = DistinctCount('City')
+    for i in range(3000):
+        (first if i < 2000 else second).add(f"city-{i}")
+        whole.add(f"city-{i}")
+    for i in range(1000):
+        second.add(f"city-{i}")
+    first.merge(second)
+    assert first.registers == whole.registers, "Merged sketch should equal the sketch of the union"
+    print("✓ Passed")
+
+    # Test 4: Edge case - no data and mismatched precision
+    print("\nTest 4 (Edge): No data and mismatched precision")
+    assert DistinctCount('City').result() == 0, "Should return 0 with no data"
+    try:
+        DistinctCount('City').merge(DistinctCount('City', p=10))
+        assert False, "Merging different precisions should raise"
+    except ValueError:
+        pass
+    print("✓ Passed")
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 50)
+    print("RUNNING ALL TEST CASES (Aggregates)")
+    print("=" * 50)
+
+    test_top_k()
+    test_quantiles()
+    test_distinct_count()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED ✓")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,225 @@
+import csv
+import os
+import subprocess
+import sys
+import time
+from superstore_cli import main, parse_filters
+import project_calculations_q2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Wall-clock timing depends on the machine, so the cold start budget is only enforced when
+# SUPERSTORE_STRICT_BENCHMARK is set; otherwise the numbers are just printed.
+# Extra time the CLI may take on top of a bare interpreter start (seconds)
+COLD_START_BUDGET = 0.15
+
+
+def write_test_csv(test_file):
+    """Writes a small superstore-style CSV used by the tests below"""
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Ship Mode', 'Category', 'State', 'Segment', 'City', 'Sales', 'Profit'])
+        writer.writerow(['Second Class', 'Furniture', 'Michigan', 'Consumer', 'Detroit', '500', '100'])
+        writer.writerow(['Second Class', 'Furniture', 'Michigan', 'Consumer', 'Lansing', '750', '-50'])
+        writer.writerow(['First Class', 'Technology', 'Texas', 'Corporate', 'Austin', '600', '200'])
+
+
+def best_run_time(args, runs=5):
+    """Fastest wall-clock time of several runs of a Python command, in seconds"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_cli_main():
+    """Test cases for the CLI main function"""
+    print("\n--- Testing superstore_cli.main ---")
+
+    # Test 1: General case - average written in the generate_output layout
+    print("\nTest 1 (General): Average written in the generate_output layout")
+    test_file = "test_cli_data_1.csv"
+    output_file = "test_cli_output_1.txt"
+    write_test_csv(test_file)
+    code = main(['--csv', test_file, '--where', 'State=Michigan', '--where', 'Segment=Consumer',
+                 '--metric', 'mean', '--column', 'Profit', '--output', output_file])
+    assert code == 0, "Should exit with 0"
+    with open(output_file, 'r') as f:
+        content = f.read()
+    assert content == "Average Profit Analysis\n=======================\nAverage Profit: $25.00\n", "Output should match the report layout"
+    print("✓ Passed")
+    os.remove(output_file)
+
+    # Test 2: General case - column names with spaces and other metrics
+    print("\nTest 2 (General): Column names with spaces and other metrics")
+    output_file = "test_cli_output_2.txt"
+    code = main(['--csv', test_file, '--where', 'Ship Mode=Second Class', '--metric', 'top_k',
+                 '--column', 'Sales', '--by', 'City', '--k', '1', '--output', output_file])
+    assert code == 0, "Should exit with 0"
+    with open(output_file, 'r') as f:
+        assert "1. Lansing: $750.00" in f.read(), "Output should list the top city"
+    assert main(['--csv', test_file, '--metric', 'distinct_count', '--column', 'City']) == 0, "Should exit with 0"
+    print("✓ Passed")
+    os.remove(output_file)
+    os.remove(test_file)
+
+    # Test 3: Edge case - file does not exist or cannot be read
+    print("\nTest 3 (Edge): File does not exist or cannot be read")
+    assert main(['--csv', 'nonexistent_cli_file.csv']) == 1, "Should exit with 1"
+    assert main(['--csv', HERE]) == 1, "A directory should exit with 1"
+    test_file = "test_cli_data_4.csv"
+    with open(test_file, 'w', newline='') as f:
+        f.write("State,Profit\nMichigan," + "9" * 200000 + "\n")
+    assert main(['--csv', test_file, '--where', 'State=Michigan']) == 1, "A malformed CSV should exit with 1"
+    os.remove(test_file)
+    print("✓ Passed")
+
+    # Test 4: Edge case - malformed filter
+    print("\nTest 4 (Edge): Malformed filter")
+    try:
+        parse_filters(['State'])
+        assert False, "Filter without = should raise"
+    except ValueError:
+        pass
+    assert parse_filters(['Ship Mode=Second Class']) == {'Ship Mode': 'Second Class'}, "Should split on the first ="
+    print("✓ Passed")
+
+    # Test 5: Edge case - out of range --q and --k are rejected before the scan
+    print("\nTest 5 (Edge): Out of range --q and --k")
+    for args in [['--metric', 'quantile', '--q', '1.5'], ['--metric', 'top_k', '--k', '0']]:
+        try:
+            main(['--csv', 'nonexistent_cli_file.csv'] + args)
+            assert False, "Out of range values should be a usage error"
+        except SystemExit as e:
+            assert e.code == 2, "Should exit with the argparse usage code"
+    print("✓ Passed")
+
+    # Test 6: Edge case - empty file keeps the last report
+    print("\nTest 6 (Edge): Empty file keeps the last report")
+    test_file = "test_cli_data_5.csv"
+    output_file = "test_cli_output_4.txt"
+    with open(output_file, 'w') as f:
+        f.write("Last good report")
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['State', 'Segment', 'Profit'])
+    assert main(['--csv', test_file, '--output', output_file]) == 1, "Header only file should exit with 1"
+    open(test_file, 'w').close()
+    assert main(['--csv', test_file, '--output', output_file]) == 1, "Zero-byte file should exit with 1"
+    with open(output_file, 'r') as f:
+        assert f.read() == "Last good report", "Report should not be overwritten"
+    write_test_csv(test_file)
+    assert main(['--csv', test_file, '--where', 'State=Ohio', '--output', output_file]) == 0, "No matches should exit with 0"
+    with open(output_file, 'r') as f:
+        assert "Average Profit: $0.00" in f.read(), "No matches should still write a report"
+    print("✓ Passed")
+    os.remove(output_file)
+    os.remove(test_file)
+
+
+def test_script_main_arguments():
+    """Test cases for the project script main function with arguments"""
+    print("\n--- Testing project_calculations_q2.main ---")
+
+    # Test 1: General case - arguments replace the hardcoded configuration
+    print("\nTest 1 (General): Arguments replace the hardcoded configuration")
+    test_file = "test_cli_data_2.csv"
+    output_file = "test_cli_output_3.txt"
+    write_test_csv(test_file)
+    project_calculations_q2.main(['--csv', test_file, '--ship-model', 'First Class',
+                                  '--category', 'Technology', '--output', output_file])
+    with open(output_file, 'r') as f:
+        assert "Average Sales: $600.00" in f.read(), "Output should contain the average sales"
+    print("✓ Passed")
+    os.remove(output_file)
+    os.remove(test_file)
+
+    # Test 2: Edge case - missing file writes no output
+    print("\nTest 2 (Edge): Missing file writes no output")
+    project_calculations_q2.main(['--csv', 'nonexistent_cli_file.csv', '--output', output_file])
+    assert not os.path.exists(output_file), "No output should be written"
+    print("✓ Passed")
+
+    # Test 3: Edge case - empty or unreadable file keeps the last report
+    print("\nTest 3 (Edge): Empty or unreadable file keeps the last report")
+    with open(output_file, 'w') as f:
+        f.write("Last good report")
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Ship Mode', 'Category', 'Sales'])
+    project_calculations_q2.main(['--csv', test_file, '--output', output_file])
+    with open(test_file, 'wb') as f:
+        f.write(b"Ship Mode,Category,Sales\nSecond Class,Furniture,\xff\n")
+    project_calculations_q2.main(['--csv', test_file, '--output', output_file])
+    project_calculations_q2.main(['--csv', HERE, '--output', output_file])
+    with open(output_file, 'r') as f:
+        assert f.read() == "Last good report", "Report should not be overwritten"
+    print("✓ Passed")
+    os.remove(test_file)
+
+    # Test 4: Edge case - no matching rows still writes a report
+    print("\nTest 4 (Edge): No matching rows still writes a report")
+    write_test_csv(test_file)
+    project_calculations_q2.main(['--csv', test_file, '--ship-model', 'Same Day', '--output', output_file])
+    with open(output_file, 'r') as f:
+        assert "Average Sales: $0.00" in f.read(), "Output should contain 0.00"
+    print("✓ Passed")
+    os.remove(output_file)
+    os.remove(test_file)
+
+
+def test_cold_start():
+    """Benchmark cases for CLI startup"""
+    print("\n--- Testing CLI cold start ---")
+
+    # Test 1: General case - importing the CLI loads nothing heavy
+    print("\nTest 1 (General): Importing the CLI loads nothing heavy")
+    check = ("import sys, superstore_cli; "
+             "print(','.join(m for m in ('argparse', 'csv', 'superstore_dataset', 'hashlib', 'random') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', check], cwd=HERE, check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == "", f"Import should be lazy, but loaded: {result.stdout.strip()}"
+    print("✓ Passed")
+
+    # Test 2: General case - an average query does not load the sketch dependencies
+    print("\nTest 2 (General): An average query does not load the sketch dependencies")
+    test_file = os.path.join(HERE, "test_cli_data_3.csv")
+    write_test_csv(test_file)
+    check = (f"import sys, superstore_cli; superstore_cli.run_query({test_file!r}, {{}}, 'mean', 'Profit'); "
+             "print(','.join(m for m in ('hashlib', 'random') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', check], cwd=HERE, check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == "", f"Average query loaded: {result.stdout.strip()}"
+    print("✓ Passed")
+
+    # Test 3: Edge case - cold start latency stays close to a bare interpreter (opt-in)
+    print("\nTest 3 (Edge): Cold start latency stays close to a bare interpreter")
+    baseline = best_run_time(['-c', 'pass'])
+    cli = best_run_time(['superstore_cli.py', '--csv', test_file, '--where', 'State=Michigan'])
+    print(f"Interpreter: {baseline * 1000:.1f} ms, CLI query: {cli * 1000:.1f} ms")
+    if os.environ.get('SUPERSTORE_STRICT_BENCHMARK'):
+        assert cli - baseline < COLD_START_BUDGET, "CLI cold start should stay within the budget"
+        print("✓ Passed")
+    else:
+        print("Reported only (set SUPERSTORE_STRICT_BENCHMARK to enforce the budget)")
+    os.remove(test_file)
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 50)
+    print("RUNNING ALL TEST CASES (CLI)")
+    print("=" * 50)
+
+    test_cli_main()
+    test_script_main_arguments()
+    test_cold_start()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED ✓")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,160 @@
+import csv
+import os
+from superstore_dataset import Dataset
+from superstore_aggregates import Count, Mean
+from project_calculations_q2 import (
+    load_samplestores,
+    filter_out,
+    calculate_average
+)
+
+
+def write_test_csv(test_file):
+    """Writes a small superstore-style CSV used by the tests below"""
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Ship Mode', 'Category', 'State', 'Segment', 'Sales', 'Profit'])
+        writer.writerow(['Second Class', 'Furniture', 'Michigan', 'Consumer', '500', '100'])
+        writer.writerow(['Second Class', 'Furniture', 'Texas', 'Consumer', '750', '-50'])
+        writer.writerow(['First Class', 'Furniture', 'Michigan', 'Consumer', '600', '200'])
+        writer.writerow(['Second Class', 'Technology', 'Michigan', 'Corporate', '800', '300'])
+        writer.writerow(['Second Class', 'Furniture', 'Michigan', 'Consumer', 'N/A', 'bad'])
+
+
+def test_dataset_scan():
+    """Test cases for Dataset.scan queries"""
+    print("\n--- Testing Dataset.scan ---")
+
+    # Test 1: General case - filter and average in one pass
+    print("\nTest 1 (General): Filter and average in one pass")
+    test_file = "test_dataset_1.csv"
+    write_test_csv(test_file)
+    result = Dataset.scan(test_file).where(State='Michigan', Segment='Consumer').mean('Profit')
+    assert result == 150.0, "Average should skip the unparsable profit and be 150.0"
+    print("✓ Passed")
+
+    # Test 2: General case - column names with spaces and chained filters
+    print("\nTest 2 (General): Column names with spaces and chained filters")
+    dataset = Dataset.scan(test_file).where({'Ship Mode': 'Second Class'}).where(Category='Furniture')
+    assert dataset.count() == 3, "Should match 3 rows"
+    assert dataset.mean('Sales') == 625.0, "Average sales should be 625.0"
+    print("✓ Passed")
+
+    # Test 3: Edge case - no matching rows
+    print("\nTest 3 (Edge): No matching rows")
+    result = Dataset.scan(test_file).where(State='California').mean('Profit')
+    assert result == 0.0, "Should return 0.0 when nothing matches"
+    print("✓ Passed")
+
+    # Test 4: Edge case - the file is only read at the terminal operation
+    print("\nTest 4 (Edge): Query on a missing file is lazy")
+    dataset = Dataset.scan("nonexistent_dataset.csv").where(State='Michigan')
+    try:
+        dataset.count()
+        assert False, "Counting a missing file should raise"
+    except FileNotFoundError:
+        pass
+    print("✓ Passed")
+    os.remove(test_file)
+
+    # Test 5: Edge case - a cell missing from a short row is skipped, a missing column counts as 0
+    print("\nTest 5 (Edge): Short rows and missing columns")
+    test_file = "test_dataset_5.csv"
+    with open(test_file, 'w', newline='') as f:
+        f.write("State,Segment,Profit\nMichigan,Consumer,10\nMichigan,Consumer\nMichigan,Consumer,\n")
+    dataset = Dataset.scan(test_file).where(State='Michigan', Segment='Consumer')
+    assert dataset.mean('Profit') == 10.0, "Short row and empty cell should both be skipped"
+    assert dataset.cache().mean('Profit') == 10.0, "Cached rows should skip the short row too"
+    assert dataset.mean('Sales') == 0.0, "A column missing from the header counts as 0"
+    data = [{'Profit': '10'}, {'Profit': None}, {'Sales': '4'}]
+    assert Dataset.from_records(data).mean('Profit') == 5.0, "Missing key counts as 0, None is skipped"
+    print("✓ Passed")
+    os.remove(test_file)
+
+
+def test_dataset_aggregate():
+    """Test cases for Dataset.aggregate"""
+    print("\n--- Testing Dataset.aggregate ---")
+
+    # Test 1: General case - several aggregators share one pass
+    print("\nTest 1 (General): Several aggregators share one pass")
+    test_file = "test_dataset_2.csv"
+    write_test_csv(test_file)
+    dataset = Dataset.scan(test_file).where(State='Michigan')
+    count, profit, sales = dataset.aggregate(Count(), Mean('Profit'), Mean('Sales'))
+    assert count == 4, "Should count 4 Michigan rows"
+    assert profit == 200.0, "Average profit should be 200.0"
+    assert abs(sales - 633.33) < 0.01, "Average sales should be approximately 633.33"
+    print("✓ Passed")
+
+    # Test 2: General case - chunked execution matches a single pass
+    print("\nTest 2 (General): Chunked execution matches a single pass")
+    for chunk_size in [1, 2, 3, 10]:
+        result = dataset.aggregate(Mean('Profit'), chunk_size=chunk_size)[0]
+        assert result == 200.0, "Chunked average should be 200.0"
+    print("✓ Passed")
+
+    # Test 3: Edge case - state merged across two datasets
+    print("\nTest 3 (Edge): State merged across two datasets")
+    first = Mean('Profit')
+    second = Mean('Profit')
+    Dataset.scan(test_file).where(State='Michigan').aggregate(first)
+    Dataset.scan(test_file).where(State='Texas').aggregate(second)
+    first.merge(second)
+    assert first.result() == 137.5, "Merged average should be 137.5"
+    print("✓ Passed")
+    os.remove(test_file)
+
+    # Test 4: Edge case - empty CSV file (only headers)
+    print("\nTest 4 (Edge): Empty CSV file (only headers)")
+    test_file = "test_dataset_3.csv"
+    with open(test_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['State', 'Segment', 'Profit'])
+    assert Dataset.scan(test_file).aggregate(Count(), Mean('Profit')) == [0, 0.0], "Should return empty results"
+    print("✓ Passed")
+    os.remove(test_file)
+
+
+def test_dataset_matches_eager_functions():
+    """Test cases comparing Dataset with the eager functions"""
+    print("\n--- Testing Dataset against the eager functions ---")
+
+    # Test 1: General case - same rows and average as filter_out + calculate_average
+    print("\nTest 1 (General): Same rows and average as the eager functions")
+    test_file = "test_dataset_4.csv"
+    write_test_csv(test_file)
+    data = load_samplestores(test_file)
+    expected_rows = filter_out(data, 'Second Class', 'Furniture')
+    expected = calculate_average(expected_rows)
+    dataset = Dataset.scan(test_file).where({'Ship Mode': 'Second Class', 'Category': 'Furniture'})
+    assert dataset.collect() == expected_rows, "Should collect the same rows"
+    assert dataset.mean('Sales') == expected, "Should compute the same average"
+    print("✓ Passed")
+
+    # Test 2: Edge case - cached dataset gives the same answers
+    print("\nTest 2 (Edge): Cached dataset gives the same answers")
+    cached = dataset.cache()
+    assert cached.mean('Sales') == expected, "Cached average should match"
+    assert cached.count() == len(expected_rows), "Cached count should match"
+    print("✓ Passed")
+    os.remove(test_file)
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 50)
+    print("RUNNING ALL TEST CASES (Dataset)")
+    print("=" * 50)
+
+    test_dataset_scan()
+    test_dataset_aggregate()
+    test_dataset_matches_eager_functions()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED ✓")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_tests()
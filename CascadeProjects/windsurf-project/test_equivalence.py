@@ -0,0 +1,278 @@
+import bisect
+import importlib.util
+import os
+import random
+from collections import Counter
+from superstore_generator import COLUMNS, generate_rows, write_csv
+from superstore_dataset import Dataset
+from superstore_aggregates import Mean
+from superstore_cli import run_query
+import project_calculations_q2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# The Question 1 script has a space in its file name, so it is loaded from its path
+_spec = importlib.util.spec_from_file_location('project_calculations_q1', os.path.join(HERE, 'project calculations.py'))
+project_calculations_q1 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(project_calculations_q1)
+
+# Eager wrappers: name, module, the two columns their filter_out checks, the column their calculate_average reads
+EAGER_WRAPPERS = [
+    ('q1', project_calculations_q1, ('State', 'Segment'), 'Profit'),
+    ('q2', project_calculations_q2, ('Ship Mode', 'Category'), 'Sales'),
+]
+
+FILTER_COLUMNS = ['State', 'Segment', 'Ship Mode', 'Category', 'Sub-Category', 'City', 'Region']
+METRIC_COLUMNS = ['Sales', 'Profit', 'Quantity', 'Discount']
+CHUNK_SIZES = [1, 7, 1000]
+
+
+def reference_filter_out(data, filters):
+    """The original filter_out loop, for any set of columns"""
+    filtered_data = []
+    for row in data:
+        if all(row.get(column) == value for column, value in filters.items()):
+            filtered_data.append(row)
+    return filtered_data
+
+
+def reference_calculate_average(filtered_data, column):
+    """The original calculate_average loop, for any column, also skipping the None cells of
+    truncated rows (the original raised TypeError on them)"""
+    total = 0.0
+    count = 0
+    for row in filtered_data:
+        try:
+            total += float(row.get(column, 0))
+            count += 1
+        except (TypeError, ValueError):
+            continue
+    return total / count if count > 0 else 0.0
+
+
+def assert_close(result, expected, message):
+    """Results may differ only by floating point summation order"""
+    assert abs(result - expected) <= 1e-9 * max(1.0, abs(expected)), f"{message}: {result} != {expected}"
+
+
+def average_modes(csv_file, data, filters, column):
+    """Runs the average query through every execution mode and returns mode name -> result"""
+    results = {}
+    results['scan'] = Dataset.scan(csv_file).where(filters).mean(column)
+    results['records'] = Dataset.from_records(data).where(filters).mean(column)
+    results['cache'] = Dataset.scan(csv_file).where(filters).cache().mean(column)
+    for chunk_size in CHUNK_SIZES:
+        mean = Mean(column)
+        results[f'chunked {chunk_size}'] = Dataset.scan(csv_file).where(filters).aggregate(mean, chunk_size=chunk_size)[0]
+    half = len(data) // 2
+    merged = Mean(column)
+    other = Mean(column)
+    Dataset.from_records(data[:half]).where(filters).aggregate(merged)
+    Dataset.from_records(data[half:]).where(filters).aggregate(other)
+    merged.merge(other)
+    results['merged halves'] = merged.result()
+    results['cli'] = run_query(csv_file, filters, 'mean', column)
+    for name, module, (first, second), metric in EAGER_WRAPPERS:
+        if set(filters) == {first, second} and column == metric:
+            filtered_data = module.filter_out(data, filters[first], filters[second])
+            results[f'eager wrappers {name}'] = module.calculate_average(filtered_data)
+    return results
+
+
+def random_query(generator, data):
+    """Picks filters from the values in the data (sometimes one that is not there) and a metric column"""
+    filters = {}
+    for column in generator.sample(FILTER_COLUMNS, generator.randint(0, 2)):
+        if data and generator.random() < 0.9:
+            filters[column] = generator.choice(data)[column]
+        else:
+            filters[column] = 'Atlantis'
+    return filters, generator.choice(METRIC_COLUMNS)
+
+
+def wrapper_query(generator, data, columns):
+    """Picks values for an eager wrapper's two filter columns from the data (sometimes one that is not there)"""
+    filters = {}
+    for column in columns:
+        value = generator.choice(data)[column] if data else None
+        filters[column] = value if value is not None and generator.random() < 0.9 else 'Atlantis'
+    return filters
+
+
+def test_generator():
+    """Test cases for the synthetic data generator"""
+    print("\n--- Testing superstore_generator ---")
+
+    # Test 1: General case - same seed gives the same rows
+    print("\nTest 1 (General): Same seed gives the same rows")
+    assert list(generate_rows(200, seed=5)) == list(generate_rows(200, seed=5)), "Rows should repeat for a seed"
+    assert list(generate_rows(200, seed=5)) != list(generate_rows(200, seed=6)), "Rows should change with the seed"
+    print("✓ Passed")
+
+    # Test 2: General case - written file loads with the SampleSuperstore columns
+    print("\nTest 2 (General): Written file loads with the SampleSuperstore columns")
+    test_file = "test_equivalence_1.csv"
+    write_csv(test_file, 300, seed=1)
+    data = project_calculations_q2.load_samplestores(test_file)
+    assert len(data) == 300, "Should load 300 records"
+    assert list(data[0].keys()) == COLUMNS, "Columns should match SampleSuperstore.csv"
+    assert data == list(generate_rows(300, seed=1)), "Loaded rows should equal the generated rows"
+    print("✓ Passed")
+    os.remove(test_file)
+
+    # Test 3: Edge case - categorical values are skewed
+    print("\nTest 3 (Edge): Categorical values are skewed")
+    rows = list(generate_rows(5000, seed=2))
+    states = Counter(row['State'] for row in rows).most_common()
+    assert states[0][1] > 5 * states[-1][1], "Most common state should be far more common than the rarest"
+    print("✓ Passed")
+
+    # Test 4: Edge case - some numeric values are malformed and some rows are truncated
+    print("\nTest 4 (Edge): Some numeric values are malformed and some rows are truncated")
+    malformed = 0
+    truncated = 0
+    for row in rows:
+        if row['Profit'] is None:
+            truncated += 1
+            continue
+        try:
+            float(row['Profit'])
+        except ValueError:
+            malformed += 1
+    assert 0.01 * len(rows) < malformed < 0.03 * len(rows), "About 2% of profits should be malformed"
+    assert 0.005 * len(rows) < truncated < 0.015 * len(rows), "About 1% of rows should be truncated"
+    clean = list(generate_rows(500, seed=2, malformed_rate=0, truncated_rate=0))
+    assert all(float(row['Sales']) >= 0 for row in clean), "No malformed values with both rates at 0"
+    print("✓ Passed")
+
+
+def test_average_equivalence():
+    """Property checks: every execution mode gives the reference average"""
+    print("\n--- Testing average equivalence ---")
+
+    # Test 1: General case - random files and random queries
+    print("\nTest 1 (General): Random files and random queries")
+    test_file = "test_equivalence_2.csv"
+    for seed in range(8):
+        generator = random.Random(seed)
+        write_csv(test_file, generator.choice([1, 25, 500, 3000]), seed=seed,
+                  malformed_rate=generator.choice([0, 0.02, 0.3]), truncated_rate=generator.choice([0, 0.01, 0.2]))
+        data = project_calculations_q2.load_samplestores(test_file)
+        queries = [random_query(generator, data) for _ in range(4)]
+        queries += [(wrapper_query(generator, data, columns), metric) for _, _, columns, metric in EAGER_WRAPPERS]
+        for filters, column in queries:
+            expected = reference_calculate_average(reference_filter_out(data, filters), column)
+            for mode, result in average_modes(test_file, data, filters, column).items():
+                assert_close(result, expected, f"seed {seed}, {mode}, {filters}, {column}")
+    print("✓ Passed")
+
+    # Test 2: General case - the two project questions on a larger file
+    print("\nTest 2 (General): The two project questions on a larger file")
+    write_csv(test_file, 20000, seed=42)
+    data = project_calculations_q2.load_samplestores(test_file)
+    questions = [
+        ({'State': 'Michigan', 'Segment': 'Consumer'}, 'Profit'),
+        ({'Ship Mode': 'Second Class', 'Category': 'Furniture'}, 'Sales'),
+    ]
+    for filters, column in questions:
+        expected = reference_calculate_average(reference_filter_out(data, filters), column)
+        for mode, result in average_modes(test_file, data, filters, column).items():
+            assert_close(result, expected, f"{mode}, {filters}, {column}")
+    print("✓ Passed")
+
+    # Test 3: Edge case - header only file
+    print("\nTest 3 (Edge): Header only file")
+    write_csv(test_file, 0)
+    for mode, result in average_modes(test_file, [], {'State': 'Michigan'}, 'Profit').items():
+        assert result == 0.0, f"{mode} should return 0.0 for an empty file"
+    print("✓ Passed")
+    os.remove(test_file)
+
+
+def other_metric_cases():
+    """Random files and queries with the exact answers worked out from the reference filter"""
+    cases = []
+    for seed in range(4):
+        generator = random.Random(100 + seed)
+        test_file = f"test_equivalence_3_{seed}.csv"
+        write_csv(test_file, 2000, seed=seed)
+        data = project_calculations_q2.load_samplestores(test_file)
+        filters, column = random_query(generator, data)
+        filtered_data = reference_filter_out(data, filters)
+        values = []
+        totals = {}
+        for row in filtered_data:
+            try:
+                value = float(row[column])
+            except (TypeError, ValueError):
+                continue
+            values.append(value)
+            totals[row['City']] = totals.get(row['City'], 0.0) + value
+        dataset = Dataset.scan(test_file).where(filters)
+        cases.append((seed, dataset, column, filtered_data, values, totals))
+    return cases
+
+
+def test_other_metric_equivalence():
+    """Property checks: count, top-k, quantiles and distinct counts against exact answers"""
+    print("\n--- Testing other metric equivalence ---")
+    cases = other_metric_cases()
+
+    # Test 1: General case - row count
+    print("\nTest 1 (General): Row count")
+    for seed, dataset, column, filtered_data, values, totals in cases:
+        assert dataset.count() == len(filtered_data), f"seed {seed}: count should match"
+    print("✓ Passed")
+
+    # Test 2: General case - top values and top groups
+    print("\nTest 2 (General): Top values and top groups")
+    for seed, dataset, column, filtered_data, values, totals in cases:
+        assert dataset.top_k(column, 5) == sorted(values, reverse=True)[:5], f"seed {seed}: top values should match"
+        expected = sorted(totals.items(), key=lambda item: (-item[1], str(item[0])))[:3]
+        assert dataset.top_k(column, 3, by='City') == expected, f"seed {seed}: top cities should match"
+    print("✓ Passed")
+
+    # Test 3: Edge case - quantile ranks within the sketch error
+    print("\nTest 3 (Edge): Quantile ranks within the sketch error")
+    for seed, dataset, column, filtered_data, values, totals in cases:
+        ordered = sorted(values)
+        for q, estimate in zip([0.5, 0.95], dataset.quantiles(column, [0.5, 0.95])):
+            if not ordered:
+                assert estimate == 0.0, f"seed {seed}: empty quantile should be 0.0"
+                continue
+            # Repeated values cover a range of ranks
+            low = bisect.bisect_left(ordered, estimate) / len(ordered)
+            high = bisect.bisect_right(ordered, estimate) / len(ordered)
+            assert low - 0.03 <= q <= high + 0.03, f"seed {seed}: quantile {q} is too far off"
+    print("✓ Passed")
+
+    # Test 4: Edge case - distinct counts within the sketch error
+    print("\nTest 4 (Edge): Distinct counts within the sketch error")
+    for seed, dataset, column, filtered_data, values, totals in cases:
+        for distinct_column in ['City', 'Postal Code', 'Sub-Category']:
+            exact = len({row[distinct_column] for row in filtered_data} - {None})
+            estimate = dataset.distinct_count(distinct_column)
+            assert abs(estimate - exact) <= max(1, 0.05 * exact), f"seed {seed}: distinct {distinct_column} is too far off"
+    print("✓ Passed")
+
+    for seed, *_ in cases:
+        os.remove(f"test_equivalence_3_{seed}.csv")
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("=" * 50)
+    print("RUNNING ALL TEST CASES (Equivalence)")
+    print("=" * 50)
+
+    test_generator()
+    test_average_equivalence()
+    test_other_metric_equivalence()
+
+    print("\n" + "=" * 50)
+    print("ALL TESTS PASSED ✓")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_tests()